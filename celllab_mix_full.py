@@ -1,66 +1,336 @@
 import sys
+import time
 import numpy as np
 from PySide6.QtWidgets import (
     QApplication, QWidget, QVBoxLayout, QHBoxLayout, QPushButton, QLabel,
     QComboBox, QSlider, QSpinBox, QFrame, QGridLayout, QDoubleSpinBox
 )
-from PySide6.QtCore import Qt, QTimer
-from PySide6.QtGui import QPainter, QColor, QPen
+from PySide6.QtCore import Qt, QTimer, QRect, QElapsedTimer
+from PySide6.QtGui import QPainter, QColor, QPen, QImage, QPixmap, QRegion
+from scipy import ndimage as ndi
+
+try:
+    from numba import njit, prange
+    HAVE_NUMBA = True
+except ImportError:
+    HAVE_NUMBA = False
+
+try:
+    import _kernels  # extensión Cython opcional (python setup.py build_ext --inplace)
+    HAVE_CKERNELS = True
+except ImportError:
+    HAVE_CKERNELS = False
+
+
+# ==============================
+# LIFE BIT A BIT (SWAR)
+# ==============================
+# Cada fila se empaqueta en palabras uint64 (bit k = columna k) y los 8
+# vecinos se suman con sumadores completos bit a bit: 64 celdas por operación.
+_U1 = np.uint64(1)
+_U63 = np.uint64(63)
+
+
+def pack_bits(grid):
+    rows, cols = grid.shape
+    words = -(-cols // 64)
+    b = np.zeros((rows, words * 8), dtype=np.uint8)
+    b[:, :-(-cols // 8)] = np.packbits(grid.astype(bool), axis=1, bitorder="little")
+    return b.view("<u8")
+
+
+def unpack_bits(bits, cols):
+    return np.unpackbits(bits.view(np.uint8), axis=1, count=cols, bitorder="little")
+
+
+def life_step_bits(x, mask, r0, r1, cols):
+    # r0, r1: buffers (rows + 2, words) para las sumas de fila con filas fantasma
+    last = np.uint64((cols - 1) % 64)
+    # Vecinos oeste/este con acarreo entre palabras; la columna 0 y la última
+    # son vecinas (borde toroidal)
+    w = x << _U1
+    w[:, 1:] |= x[:, :-1] >> _U63
+    w[:, 0] |= (x[:, -1] >> last) & _U1
+    e = x >> _U1
+    e[:, :-1] |= x[:, 1:] << _U63
+    e[:, -1] |= (x[:, 0] & _U1) << last
+    # Suma horizontal: 2 vecinos (s1 s0) y la fila completa de 3 celdas (r1 r0).
+    # Las filas fantasma repiten la última y la primera fila, así las filas
+    # vecinas son vistas sin copias.
+    s0 = w ^ e
+    s1 = w & e
+    np.bitwise_xor(s0, x, out=r0[1:-1])
+    np.bitwise_or(s1, s0 & x, out=r1[1:-1])
+    for r in (r0, r1):
+        r[0] = r[-2]
+        r[-1] = r[1]
+    u0, u1 = r0[:-2], r1[:-2]
+    d0, d1 = r0[2:], r1[2:]
+    # n = o0 + 2*t; nos interesa t == 1 (n es 2 o 3)
+    o0 = u0 ^ s0 ^ d0
+    oc = (u0 & s0) | (d0 & (u0 ^ s0))
+    a1 = u1 ^ s1; c1 = u1 & s1
+    a2 = d1 ^ oc; c2 = d1 & oc
+    t_one = (a1 ^ a2) & ~(c1 | c2)
+    return t_one & (o0 | x) & mask
+
+
+# ==============================
+# KERNELS NUMBA (opcionales)
+# ==============================
+# Todos los kernels usan bordes toroidales: la fila/columna -1 es la última.
+
+# Regla B3/S23 como tabla [estado, vecinos] -> siguiente estado: una lectura
+# sin saltos en lugar de comparaciones que el predictor falla sobre grillas al azar
+_LIFE_LUT = np.zeros((2, 9), dtype=np.uint8)
+_LIFE_LUT[0, 3] = _LIFE_LUT[1, 2] = _LIFE_LUT[1, 3] = 1
+
+if HAVE_NUMBA:
+    @njit(parallel=True, cache=True)
+    def _life_step(g, out):
+        rows, cols = g.shape
+        for i in prange(rows):
+            im = i - 1 if i > 0 else rows - 1
+            ip = i + 1 if i < rows - 1 else 0
+            for j in range(cols):
+                jm = j - 1 if j > 0 else cols - 1
+                jp = j + 1 if j < cols - 1 else 0
+                n = (g[im, jm] + g[im, j] + g[im, jp]
+                     + g[i, jm] + g[i, jp]
+                     + g[ip, jm] + g[ip, j] + g[ip, jp])
+                out[i, j] = _LIFE_LUT[g[i, j], n]
+
+    @njit(parallel=True, cache=True)
+    def _fire_step(g, out, rand, p_growth, p_lightning):
+        # rand: un número uniforme por celda; cada celda consume a lo sumo uno
+        rows, cols = g.shape
+        for i in prange(rows):
+            im = i - 1 if i > 0 else rows - 1
+            ip = i + 1 if i < rows - 1 else 0
+            for j in range(cols):
+                v = g[i, j]
+                if v == 2:
+                    out[i, j] = 0
+                elif v == 1:
+                    jm = j - 1 if j > 0 else cols - 1
+                    jp = j + 1 if j < cols - 1 else 0
+                    burn = (rand[i, j] < p_lightning
+                            or g[im, jm] == 2 or g[im, j] == 2 or g[im, jp] == 2
+                            or g[i, jm] == 2 or g[i, jp] == 2
+                            or g[ip, jm] == 2 or g[ip, j] == 2 or g[ip, jp] == 2)
+                    out[i, j] = 2 if burn else 1
+                elif v == 0:
+                    out[i, j] = 1 if rand[i, j] < p_growth else 0
+                else:
+                    out[i, j] = v
+
+
+# Tope de repintados por segundo de la simulación
+MAX_FPS = 30
+# Intervalo mínimo entre actualizaciones de la barra de estado en marcha
+STATUS_INTERVAL_MS = 250
+
+
+# ==============================
+# PATRONES PREDETERMINADOS
+# ==============================
+# Se construyen una sola vez, ya en el dtype de la grilla
+_PATTERNS = {
+    "Glider": np.array([
+        [0, 1, 0],
+        [0, 0, 1],
+        [1, 1, 1]
+    ], dtype=np.uint8),
+    "Blinker": np.array([
+        [1, 1, 1]
+    ], dtype=np.uint8),
+    "Toad": np.array([
+        [0, 1, 1, 1],
+        [1, 1, 1, 0]
+    ], dtype=np.uint8),
+    "Beacon": np.array([
+        [1, 1, 0, 0],
+        [1, 1, 0, 0],
+        [0, 0, 1, 1],
+        [0, 0, 1, 1]
+    ], dtype=np.uint8),
+    "Pulsar": np.array([
+        [0,0,1,1,1,0,0,0,1,1,1,0,0],
+        [0,0,0,0,0,0,0,0,0,0,0,0,0],
+        [1,0,0,0,0,1,0,1,0,0,0,0,1],
+        [1,0,0,0,0,1,0,1,0,0,0,0,1],
+        [1,0,0,0,0,1,0,1,0,0,0,0,1],
+        [0,0,1,1,1,0,0,0,1,1,1,0,0],
+        [0,0,0,0,0,0,0,0,0,0,0,0,0],
+        [0,0,1,1,1,0,0,0,1,1,1,0,0],
+        [1,0,0,0,0,1,0,1,0,0,0,0,1],
+        [1,0,0,0,0,1,0,1,0,0,0,0,1],
+        [1,0,0,0,0,1,0,1,0,0,0,0,1],
+        [0,0,0,0,0,0,0,0,0,0,0,0,0],
+        [0,0,1,1,1,0,0,0,1,1,1,0,0]
+    ], dtype=np.uint8)
+}
 
 
 # ==============================
 # CLASE CANVAS DE DIBUJO
 # ==============================
 class AutomataCanvas(QFrame):
+    # Paletas ARGB32 indexadas por estado de celda (mismo largo en ambos modelos)
+    _PALETTE_LIFE = np.array([0xFFFFFFFF, 0xFF000000, 0xFFFFFFFF, 0xFFFFFFFF], dtype=np.uint32)
+    _PALETTE_FIRE = np.array([0xFFFFFFFF, 0xFF228B22, 0xFFFF4500, 0xFF000000], dtype=np.uint32)
+
+    # Por encima de este número de celdas cambiadas se redibuja todo el pixmap
+    _MAX_DIRTY_CELLS = 256
+
     def __init__(self, rows, cols, cell_size=15, model="life"):
         super().__init__()
         self.rows = rows
         self.cols = cols
         self.cell_size = cell_size
-        self.grid = np.zeros((rows, cols), dtype=int)
+        self.grid = np.zeros((rows, cols), dtype=np.uint8)
         self.model = model
         self.setFixedSize(cols * cell_size, rows * cell_size)
-        self.setStyleSheet("background-color: white; border: 1px solid #444;")
+        # paintEvent cubre cada pixel con el pixmap: Qt no necesita borrar el fondo
+        self.setAttribute(Qt.WA_OpaquePaintEvent, True)
+        self.setAttribute(Qt.WA_NoSystemBackground, True)
+        self.setAttribute(Qt.WA_StaticContents, True)
         self.setMouseTracking(True)
+        self._grid_pen = QPen(QColor(220, 220, 220))
+        self._colors_life = [QColor.fromRgba(int(c)) for c in self._PALETTE_LIFE]
+        self._colors_fire = [QColor.fromRgba(int(c)) for c in self._PALETTE_FIRE]
+        self._pix = QPixmap(cols * cell_size, rows * cell_size)
+        self._render_overlay()
+        self._render_pixmap()
+
+        # Las ediciones con el ratón se acumulan y se repintan como mucho a ~60 Hz
+        self._dirty = QRegion()
+        self._repaint_timer = QTimer(self)
+        self._repaint_timer.setSingleShot(True)
+        self._repaint_timer.setInterval(16)
+        self._repaint_timer.timeout.connect(self._flush_repaint)
 
     def set_model(self, model_name: str):
         self.model = model_name
+        self._render_pixmap()
         self.update()
 
     def set_grid_shape(self, rows, cols):
-        new = np.zeros((rows, cols), dtype=int)
+        new = np.zeros((rows, cols), dtype=np.uint8)
         hh = min(rows, self.rows)
         ww = min(cols, self.cols)
         new[:hh, :ww] = self.grid[:hh, :ww]
         self.grid = new
         self.rows, self.cols = rows, cols
         self.setFixedSize(cols * self.cell_size, rows * self.cell_size)
+        self._pix = QPixmap(cols * self.cell_size, rows * self.cell_size)
+        self._render_overlay()
+        self._render_pixmap()
         self.update()
 
-    def paintEvent(self, event):
-        painter = QPainter(self)
+    def refresh(self):
+        """Sincroniza el pixmap con self.grid y repinta solo la zona cambiada."""
+        if self._shown.shape != self.grid.shape:
+            self._render_pixmap()
+            self.update()
+            return
+        diff = self.grid != self._shown
+        n_changed = np.count_nonzero(diff)
+        if n_changed == 0:
+            return
+        cs = self.cell_size
+        if n_changed > self._MAX_DIRTY_CELLS:
+            # Muchos cambios: se re-renderiza de una vez la caja que los contiene
+            rows_any = np.flatnonzero(diff.any(axis=1))
+            cols_any = np.flatnonzero(diff.any(axis=0))
+            r0, r1 = int(rows_any[0]), int(rows_any[-1]) + 1
+            c0, c1 = int(cols_any[0]), int(cols_any[-1]) + 1
+            self._render_pixmap(r0, r1, c0, c1)
+        else:
+            changed = np.argwhere(diff)
+            rr, cc = changed[:, 0], changed[:, 1]
+            vals = self.grid[rr, cc]
+            self._shown[rr, cc] = vals
+            painter = QPainter(self._pix)
+            painter.setPen(self._grid_pen)
+            colors = self._colors()
+            # Listas de int de Python: evita indexar escalares de NumPy por celda
+            for r, c, v in zip(rr.tolist(), cc.tolist(), vals.tolist()):
+                self._paint_cell(painter, colors[v], r, c)
+            painter.end()
+            (r0, c0), (r1, c1) = changed.min(axis=0), changed.max(axis=0) + 1
+        self.update(QRect(c0 * cs, r0 * cs, (c1 - c0) * cs + 1, (r1 - r0) * cs + 1))
+
+    def _palette(self):
+        return self._PALETTE_LIFE if self.model == "life" else self._PALETTE_FIRE
+
+    def _colors(self):
+        return self._colors_life if self.model == "life" else self._colors_fire
+
+    def _render_pixmap(self, r0=0, r1=None, c0=0, c1=None):
+        """Re-renderiza en el pixmap las celdas [r0:r1, c0:c1] (por defecto, todas)."""
+        full = r1 is None and c1 is None
+        r1 = self.rows if r1 is None else r1
+        c1 = self.cols if c1 is None else c1
         cs = self.cell_size
-        painter.fillRect(self.rect(), QColor(255, 255, 255))
+        target = QRect(c0 * cs, r0 * cs, (c1 - c0) * cs, (r1 - r0) * cs)
+        block = self.grid[r0:r1, c0:c1]
+        painter = QPainter(self._pix)
+
+        # Una sola imagen (1 pixel por celda) escalada al tamaño del bloque
+        self._rgba_cache = np.ascontiguousarray(self._palette()[block])
+        img = QImage(self._rgba_cache.data, c1 - c0, r1 - r0, QImage.Format_RGB32)
+        painter.setRenderHint(QPainter.SmoothPixmapTransform, False)
+        painter.drawImage(target, img)
+        painter.drawPixmap(target, self._grid_overlay, target)
+        painter.end()
+        if full:
+            self._shown = self.grid.copy()
+        else:
+            self._shown[r0:r1, c0:c1] = block
 
-        for i in range(self.rows):
-            for j in range(self.cols):
-                val = int(self.grid[i, j])
+    def _render_overlay(self):
+        # Rejilla fija (transparente): solo cambia con el tamaño de la grilla
+        cs = self.cell_size
+        w, h = self.cols * cs, self.rows * cs
+        self._grid_overlay = QPixmap(w, h)
+        self._grid_overlay.fill(Qt.transparent)
+        painter = QPainter(self._grid_overlay)
+        painter.setPen(self._grid_pen)
+        for i in range(self.rows + 1):
+            painter.drawLine(0, i * cs, w, i * cs)
+        for j in range(self.cols + 1):
+            painter.drawLine(j * cs, 0, j * cs, h)
+        painter.end()
+
+    def _paint_cell(self, painter, color, row, col):
+        cs = self.cell_size
+        painter.fillRect(col * cs, row * cs, cs, cs, color)
+        painter.drawRect(col * cs, row * cs, cs, cs)
 
-                if self.model == "life":
-                    color = QColor(0, 0, 0) if val == 1 else QColor(255, 255, 255)
-                else:
-                    if val == 0:
-                        color = QColor(255, 255, 255)
-                    elif val == 1:
-                        color = QColor(34, 139, 34)
-                    elif val == 2:
-                        color = QColor(255, 69, 0)
-                    else:
-                        color = QColor(0, 0, 0)
-
-                painter.fillRect(j * cs, i * cs, cs, cs, color)
-                painter.setPen(QPen(QColor(220, 220, 220)))
-                painter.drawRect(j * cs, i * cs, cs, cs)
+    def _set_cell(self, row, col, val):
+        cs = self.cell_size
+        self.grid[row, col] = val
+        self._shown[row, col] = val
+        painter = QPainter(self._pix)
+        painter.setPen(self._grid_pen)
+        self._paint_cell(painter, self._colors()[val], row, col)
+        painter.end()
+        self._schedule_repaint(QRect(col * cs, row * cs, cs + 1, cs + 1))
+
+    def _schedule_repaint(self, rect):
+        self._dirty = self._dirty.united(rect)
+        if not self._repaint_timer.isActive():
+            self._repaint_timer.start()
+
+    def _flush_repaint(self):
+        self.update(self._dirty)
+        self._dirty = QRegion()
+
+    def paintEvent(self, event):
+        painter = QPainter(self)
+        rect = event.rect()
+        painter.drawPixmap(rect, self._pix, rect)
 
     def _pos_to_cell(self, ev):
         try:
@@ -77,20 +347,15 @@ class AutomataCanvas(QFrame):
         row, col = self._pos_to_cell(event)
         if 0 <= row < self.rows and 0 <= col < self.cols:
             if self.model == "life":
-                self.grid[row, col] = 1 - int(self.grid[row, col])
+                self._set_cell(row, col, 1 - int(self.grid[row, col]))
             else:
-                self.grid[row, col] = (int(self.grid[row, col]) + 1) % 3
-            self.update()
+                self._set_cell(row, col, (int(self.grid[row, col]) + 1) % 3)
 
     def mouseMoveEvent(self, event):
         if event.buttons() & Qt.LeftButton:
             row, col = self._pos_to_cell(event)
             if 0 <= row < self.rows and 0 <= col < self.cols:
-                if self.model == "life":
-                    self.grid[row, col] = 1
-                else:
-                    self.grid[row, col] = 1
-                self.update()
+                self._set_cell(row, col, 1)
 
 
 # ==============================
@@ -105,11 +370,33 @@ class CellularAutomaton(QWidget):
         self.cell_size = 15
         self.model = "life"
         self.tick = 0
+        self._rng = np.random.default_rng()
 
         self.canvas = AutomataCanvas(self.rows, self.cols, self.cell_size, model=self.model)
+        self._alloc_buffers()
+        self._bind_step()
 
+        # Timer de un disparo: cada tick se reprograma descontando lo que tardó,
+        # así un paso lento no acumula ticks pendientes en la cola de eventos
         self.timer = QTimer()
-        self.timer.timeout.connect(self.update_grid)
+        self.timer.setSingleShot(True)
+        self.timer.timeout.connect(self._run_tick)
+        self._running = False
+        self._status_clock = QElapsedTimer()
+        self._status_clock.start()
+
+        # Clics seguidos (o la autorepetición) en ancho/alto se agrupan en un
+        # único resize_grid cuando pasan 50 ms sin cambios
+        self._resize_timer = QTimer(self)
+        self._resize_timer.setSingleShot(True)
+        self._resize_timer.setInterval(50)
+        self._resize_timer.timeout.connect(self.resize_grid)
+
+        # Al arrastrar el slider solo se aplica el último valor
+        self._speed_timer = QTimer(self)
+        self._speed_timer.setSingleShot(True)
+        self._speed_timer.setInterval(50)
+        self._speed_timer.timeout.connect(self._flush_speed)
 
         self.init_ui()
 
@@ -129,14 +416,14 @@ class CellularAutomaton(QWidget):
         self.width_spin = QSpinBox()
         self.width_spin.setRange(10, 200)
         self.width_spin.setValue(self.cols)
-        self.width_spin.valueChanged.connect(self.resize_grid)
+        self.width_spin.valueChanged.connect(self._schedule_resize)
         top_bar.addWidget(self.width_spin)
 
         top_bar.addWidget(QLabel("Alto:"))
         self.height_spin = QSpinBox()
         self.height_spin.setRange(10, 200)
         self.height_spin.setValue(self.rows)
-        self.height_spin.valueChanged.connect(self.resize_grid)
+        self.height_spin.valueChanged.connect(self._schedule_resize)
         top_bar.addWidget(self.height_spin)
 
         # 🔹 Patrón predeterminado
@@ -168,7 +455,8 @@ class CellularAutomaton(QWidget):
         self.speed_label = QLabel("Velocidad (ticks/seg):")
         top_bar.addWidget(self.speed_label)
         self.speed_slider = QSlider(Qt.Horizontal)
-        self.speed_slider.setRange(1, 30)
+        # 0 = sin límite: el timer se reprograma con intervalo 0
+        self.speed_slider.setRange(0, 60)
         self.speed_slider.setValue(10)
         self.speed_slider.valueChanged.connect(self.change_speed)
         top_bar.addWidget(self.speed_slider)
@@ -196,73 +484,156 @@ class CellularAutomaton(QWidget):
 
         layout.addLayout(fire_layout)
 
-        self.status_label = QLabel("Tick: 0 | Vivos: 0 | Densidad: 0.000")
+        self._last_status = "Tick: 0 | Vivos: 0 | Densidad: 0.000"
+        self.status_label = QLabel(self._last_status)
         layout.addWidget(self.status_label)
 
         self.stop_btn.setEnabled(False)
-        init_tps = max(1, self.speed_slider.value())
-        self.timer.setInterval(int(1000 / init_tps))
+        self._apply_speed(self.speed_slider.value())
 
     # ==============================
     # FUNCIONALIDAD
     # ==============================
     def change_model(self, model):
         self.model = model
+        self._bind_step()
         self.canvas.set_model(model)
         self.clear()
 
+    def _bind_step(self):
+        # Se resuelve el modelo una vez, no en cada tick
+        self._step_fn = self.update_life if self.model == "life" else self.update_fire
+
     def change_speed(self, value):
-        tps = max(1, int(value))
-        self.timer.setInterval(int(1000 / tps))
+        self._speed_timer.start()
+
+    def _flush_speed(self):
+        self._apply_speed(self.speed_slider.value())
+
+    def _apply_speed(self, value):
+        tps = int(value)
+        if tps <= 0:
+            # _run_tick ajusta los pasos por repintado a partir de aquí
+            self._steps_per_frame = 1
+            self._target_ms = 0
+            self.speed_label.setText("Velocidad (ticks/seg): Máximo")
+            return
+        # Por encima de MAX_FPS se avanzan varios pasos por repintado;
+        # redondeando hacia arriba ni los repintados ni los ticks superan lo pedido
+        self._steps_per_frame = -(-tps // MAX_FPS)
+        self._target_ms = -(-1000 * self._steps_per_frame // tps)
+        self.speed_label.setText(f"Velocidad (ticks/seg): {tps}")
+
+    def _schedule_resize(self, _value):
+        self._resize_timer.start()
 
     def resize_grid(self):
-        self.rows = self.height_spin.value()
-        self.cols = self.width_spin.value()
+        rows, cols = self.height_spin.value(), self.width_spin.value()
+        if (rows, cols) == (self.rows, self.cols):
+            return
+        self.rows, self.cols = rows, cols
         self.canvas.set_grid_shape(self.rows, self.cols)
+        self._alloc_buffers()
         self.tick = 0
 
+    def _alloc_buffers(self):
+        # Buffers reutilizados en cada tick (se recrean solo al cambiar el tamaño)
+        self._bit_mask = pack_bits(np.ones((1, self.cols), dtype=np.uint8))
+        words = self._bit_mask.shape[1]
+        self._row_sum0 = np.empty((self.rows + 2, words), dtype=self._bit_mask.dtype)
+        self._row_sum1 = np.empty((self.rows + 2, words), dtype=self._bit_mask.dtype)
+        self._next = np.empty_like(self.canvas.grid)
+        self._rand = np.empty((self.rows, self.cols), dtype=np.float64)
+        self._fire_near = np.empty((self.rows, self.cols), dtype=bool)
+        # Planos de estado de Fire (EMPTY / TREE / FIRE) reutilizados cada tick
+        self._empty = np.empty((self.rows, self.cols), dtype=bool)
+        self._trees = np.empty((self.rows, self.cols), dtype=bool)
+        self._burning = np.empty((self.rows, self.cols), dtype=bool)
+
     def start(self):
-        if not self.timer.isActive():
-            tps = max(1, self.speed_slider.value())
-            self.timer.setInterval(int(1000 / tps))
-            self.timer.start()
+        if not self._running:
+            self._apply_speed(self.speed_slider.value())
+            self._running = True
+            self.timer.start(self._target_ms)
             self.play_btn.setEnabled(False)
             self.stop_btn.setEnabled(True)
 
     def stop(self):
+        self._running = False
         self.timer.stop()
+        self._show_status()
         self.play_btn.setEnabled(True)
         self.stop_btn.setEnabled(False)
 
     def step(self):
         self.update_grid()
 
+    def _run_tick(self):
+        t0 = time.perf_counter()
+        self.update_grid(self._steps_per_frame)
+        if not self._running:
+            return
+        elapsed = (time.perf_counter() - t0) * 1000
+        if self._target_ms == 0:
+            # Modo máximo: se reparten los pasos para que cada repintado cubra
+            # ~1000 / MAX_FPS ms de cálculo (crece como mucho al doble por frame)
+            scale = (1000 / MAX_FPS) / max(elapsed, 0.01)
+            self._steps_per_frame = max(1, min(int(self._steps_per_frame * scale),
+                                               2 * self._steps_per_frame))
+            self.timer.start(0)
+        else:
+            self.timer.start(max(0, self._target_ms - int(elapsed)))
+
     def randomize(self):
+        # Se rellena la grilla actual en su sitio usando los buffers del tick
+        grid = self.canvas.grid
+        r = self._rng.random(out=self._rand)
         if self.model == "life":
-            self.canvas.grid = np.random.choice([0, 1], (self.rows, self.cols))
+            np.greater_equal(r, 0.5, out=grid.view(np.bool_))
         elif self.model == "fire":
-            self.canvas.grid = np.random.choice([0, 1, 2], (self.rows, self.cols), p=[0.7, 0.25, 0.05])
-        self.canvas.update()
+            # 70 % vacío, 25 % árbol, 5 % fuego
+            np.greater_equal(r, 0.7, out=grid.view(np.bool_))
+            grid += np.greater_equal(r, 0.95, out=self._fire_near)
+        self.canvas.refresh()
         self.tick = 0
 
     def clear(self):
-        self.canvas.grid = np.zeros((self.rows, self.cols), dtype=int)
-        self.canvas.update()
-        self.tick = 0
-        self.status_label.setText("Tick: 0 | Vivos: 0 | Densidad: 0.000")
+        self._clear_no_repaint()
+        self.canvas.refresh()
 
-    def update_grid(self):
-        grid = self.canvas.grid.copy()
-        if self.model == "life":
-            new_grid = self.update_life(grid)
-        else:
-            new_grid = self.update_fire(grid)
-        self.canvas.grid = new_grid
-        self.canvas.update()
-        self.tick += 1
-        alive = np.sum(new_grid > 0)
+    def _clear_no_repaint(self):
+        self.canvas.grid.fill(0)
+        self.tick = 0
+        self._set_status("Tick: 0 | Vivos: 0 | Densidad: 0.000")
+
+    def update_grid(self, steps=1):
+        for _ in range(steps):
+            grid = self.canvas.grid
+            new_grid = self._step_fn(grid, self._next)
+            # Doble buffer: el estado anterior pasa a ser el destino del próximo tick
+            self.canvas.grid, self._next = new_grid, grid
+        # refresh() no repinta nada si la grilla coincide con lo ya mostrado
+        self.canvas.refresh()
+        self.tick += steps
+        alive = np.count_nonzero(new_grid)
+        if not self._running or self._status_clock.elapsed() >= STATUS_INTERVAL_MS:
+            self._show_status(alive)
+        # Sin celdas vivas (y sin crecimiento en Fire) el estado ya no cambia
+        if alive == 0 and self._running and (self.model == "life" or self.p_growth.value() == 0):
+            self.stop()
+
+    def _show_status(self, alive=None):
+        if alive is None:
+            alive = np.count_nonzero(self.canvas.grid)
         density = alive / (self.rows * self.cols) if (self.rows * self.cols) else 0.0
-        self.status_label.setText(f"Tick: {self.tick} | Vivos: {alive} | Densidad: {density:.3f}")
+        self._set_status(f"Tick: {self.tick} | Vivos: {alive} | Densidad: {density:.3f}")
+        self._status_clock.restart()
+
+    def _set_status(self, text):
+        # QLabel.setText invalida el layout aunque el texto no cambie
+        if text != self._last_status:
+            self._last_status = text
+            self.status_label.setText(text)
 
     # ==============================
     # PATRONES PREDETERMINADOS
@@ -270,85 +641,68 @@ class CellularAutomaton(QWidget):
     def insert_pattern(self, name):
         if self.model != "life":
             return  # solo aplica a Conway
-        self.clear()
+        # Un único refresh tras limpiar y pegar el patrón
+        self._clear_no_repaint()
         g = self.canvas.grid
         mid_r, mid_c = self.rows // 2, self.cols // 2
 
-        patterns = {
-            "Glider": np.array([
-                [0, 1, 0],
-                [0, 0, 1],
-                [1, 1, 1]
-            ]),
-            "Blinker": np.array([
-                [1, 1, 1]
-            ]),
-            "Toad": np.array([
-                [0, 1, 1, 1],
-                [1, 1, 1, 0]
-            ]),
-            "Beacon": np.array([
-                [1, 1, 0, 0],
-                [1, 1, 0, 0],
-                [0, 0, 1, 1],
-                [0, 0, 1, 1]
-            ]),
-            "Pulsar": np.array([
-                [0,0,1,1,1,0,0,0,1,1,1,0,0],
-                [0,0,0,0,0,0,0,0,0,0,0,0,0],
-                [1,0,0,0,0,1,0,1,0,0,0,0,1],
-                [1,0,0,0,0,1,0,1,0,0,0,0,1],
-                [1,0,0,0,0,1,0,1,0,0,0,0,1],
-                [0,0,1,1,1,0,0,0,1,1,1,0,0],
-                [0,0,0,0,0,0,0,0,0,0,0,0,0],
-                [0,0,1,1,1,0,0,0,1,1,1,0,0],
-                [1,0,0,0,0,1,0,1,0,0,0,0,1],
-                [1,0,0,0,0,1,0,1,0,0,0,0,1],
-                [1,0,0,0,0,1,0,1,0,0,0,0,1],
-                [0,0,0,0,0,0,0,0,0,0,0,0,0],
-                [0,0,1,1,1,0,0,0,1,1,1,0,0]
-            ])
-        }
-
-        if name != "Ninguno" and name in patterns:
-            p = patterns[name]
+        p = _PATTERNS.get(name)
+        if p is not None:
             pr, pc = p.shape
             start_r = mid_r - pr // 2
             start_c = mid_c - pc // 2
             g[start_r:start_r+pr, start_c:start_c+pc] = p
-            self.canvas.update()
+        self.canvas.refresh()
 
     # ==============================
     # MODELOS
     # ==============================
-    def update_life(self, grid):
-        new_grid = grid.copy()
-        for i in range(self.rows):
-            for j in range(self.cols):
-                total = np.sum(grid[max(0, i - 1):min(self.rows, i + 2),
-                                    max(0, j - 1):min(self.cols, j + 2)]) - grid[i, j]
-                if grid[i, j] == 1 and (total < 2 or total > 3):
-                    new_grid[i, j] = 0
-                elif grid[i, j] == 0 and total == 3:
-                    new_grid[i, j] = 1
-        return new_grid
-
-    def update_fire(self, grid):
+    def update_life(self, grid, out):
+        if HAVE_CKERNELS:
+            _kernels.life_step(grid, out)
+            return out
+        if HAVE_NUMBA:
+            _life_step(grid, out)
+            return out
+        bits = life_step_bits(pack_bits(grid), self._bit_mask,
+                              self._row_sum0, self._row_sum1, self.cols)
+        out[:] = unpack_bits(bits, self.cols)
+        return out
+
+    def update_fire(self, grid, out):
         p_growth = float(self.p_growth.value())
         p_lightning = float(self.p_lightning.value())
-        new_grid = grid.copy()
-        for i in range(self.rows):
-            for j in range(self.cols):
-                if grid[i, j] == 2:
-                    new_grid[i, j] = 0
-                elif grid[i, j] == 1:
-                    neighbors = grid[max(0, i - 1):min(self.rows, i + 2),
-                                     max(0, j - 1):min(self.cols, j + 2)]
-                    if np.any(neighbors == 2) or np.random.random() < p_lightning:
-                        new_grid[i, j] = 2
-                elif grid[i, j] == 0 and np.random.random() < p_growth:
-                    new_grid[i, j] = 1
-        return new_grid
+        if HAVE_CKERNELS or HAVE_NUMBA:
+            rand = self._rng.random(out=self._rand)
+            if HAVE_CKERNELS:
+                _kernels.fire_step(grid, out, rand, p_growth, p_lightning)
+            else:
+                _fire_step(grid, out, rand, p_growth, p_lightning)
+            return out
+        empty = np.equal(grid, 0, out=self._empty)
+        trees = np.equal(grid, 1, out=self._trees)
+        burning = np.equal(grid, 2, out=self._burning)
+        # Fuego en la vecindad 3x3: una sola dilatación en C sobre la máscara
+        fire_near = ndi.maximum_filter(burning, size=3, mode="wrap", output=self._fire_near)
+        out[:] = grid
+        out[burning] = 0
+        out[np.logical_and(trees, fire_near, out=fire_near)] = 2
+        flat = out.reshape(-1)
+        flat[self._sample_cells(trees, p_lightning)] = 2
+        flat[self._sample_cells(empty, p_growth)] = 1
+        return out
+
+    def _sample_cells(self, mask, p):
+        """Índices planos de las celdas de mask que se activan con probabilidad p.
+
+        Con p pequeño basta un binomial y k índices al azar en vez de un
+        número aleatorio por celda.
+        """
+        idx = np.flatnonzero(mask)
+        k = self._rng.binomial(len(idx), p)
+        if k == 0:
+            return idx[:0]
+        return idx[self._rng.choice(len(idx), size=k, replace=False)]
 
 
 # ==============================
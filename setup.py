@@ -0,0 +1,15 @@
+"""Compila los kernels opcionales en C: python setup.py build_ext --inplace"""
+import sys
+
+from setuptools import setup, Extension
+from Cython.Build import cythonize
+
+if sys.platform == "win32":
+    compile_args, link_args = ["/O2", "/openmp"], []
+else:
+    compile_args, link_args = ["-O3", "-fopenmp"], ["-fopenmp"]
+
+ext = Extension("_kernels", ["_kernels.pyx"],
+                extra_compile_args=compile_args, extra_link_args=link_args)
+
+setup(name="celllab-kernels", ext_modules=cythonize([ext], language_level=3))